@@ -1,24 +1,34 @@
 # Import necessary libraries and modules
 import os
 import re
-import nltk
-import pandas as pd
-from constants import EXTRACTED_DATA_FOLDER, PERSONAL_PRONOUNS
+import string
+import sys
+from collections import Counter
+from constants import EXTRACTED_DATA_FOLDER, OUTPUT_COLUMNS, PERSONAL_PRONOUNS
 from helpers.syllables_count import sylco
 
+# compiled once, used for every token of every article
+# a word is a run of letters; like the Treebank tokenizer, contractions are split into the head
+# and its suffix (I'm -> I 'm, don't -> do n't) so the head is never glued to the suffix
+_WORD_RE = re.compile(r"[a-z]+?(?=n't)|n't|'[a-z]+|[a-z]+", re.IGNORECASE)
+# a sentence runs up to its closing punctuation, or to the end of the text
+_SENT_RE = re.compile(r'[^.!?\s][^.!?]*(?:[.!?]+|$)')
+# deletes every character below 256 that is not an ASCII letter or whitespace, which covers
+# everything _WORD_RE can produce besides letters (the apostrophe of a contraction suffix)
+_PUNCT_TABLE = str.maketrans('', '', ''.join(c for c in map(chr, range(256))
+                                             if c not in string.ascii_letters and not c.isspace()))
+# the scores of an article without text, every column after URL_ID and URL
+_EMPTY_SCORES = ('NaN',) * (len(OUTPUT_COLUMNS) - 2)
+
 
 class Analyser:
     """
     The Analyser class performs text analysis on the content extracted from URLs.
 
     Attributes:
-    - positive_words (set): Set of positive words.
-    - negative_words (set): Set of negative words.
-    - stopwords (set): Set of stopwords.
-    - personal_pronouns (int): Count of personal pronouns.
-    - number_of_words (int): Count of words in the text.
-    - number_of_sentences (int): Count of sentences in the text.
-    - complex_words_count (int): Count of complex words.
+    - positive_words (frozenset): Set of positive words.
+    - negative_words (frozenset): Set of negative words.
+    - stopwords (frozenset): Set of stopwords.
 
     Methods:
     - positive_score: Calculates the positive score for a given set of words.
@@ -26,12 +36,8 @@ class Analyser:
     - polarity_score: Calculates the polarity score using positive and negative scores.
     - subjectivity_score: Calculates the subjectivity score using positive, negative scores, and the number of words.
     - average_sentence_length: Calculates the average sentence length.
-    - complex_words: Identifies and counts complex words in a set of words.
-    - average_word_length: Calculates the average word length.
     - syllable_count: Calculates the syllable count for a given word.
-    - clean: Cleans and filters a set of words.
-    - clean_stop_words: Removes stopwords from a set of words.
-    - analyse: Performs text analysis and writes the results to an output CSV file.
+    - analyse: Performs text analysis and returns the results as one output row.
 
     """
 
@@ -40,39 +46,40 @@ class Analyser:
         Initializes the Analyser with sets of positive words, negative words, and stopwords.
 
         """
-        self.positive_words = set(positive_words)
-        self.negative_words = set(negative_words)
-        self.stopwords = set(stopwords)
-        self.personal_pronouns = 0
-        self.number_of_words = 0
-        self.number_of_sentences = 0
-        self.complex_words_count = 0
+        # interned so that lookups of the (also interned) tokens compare by identity
+        self.positive_words = frozenset(sys.intern(word) for word in positive_words)
+        self.negative_words = frozenset(sys.intern(word) for word in negative_words)
+        self.stopwords = frozenset(sys.intern(word) for word in stopwords)
 
     def positive_score(self, words):
         """
         Calculates the positive score for a given set of words.
 
         Parameters:
-        - words (list): List of words.
+        - words (set or list): Words of the article, deduplicated if not already a set.
 
         Returns:
         - int: Positive score.
 
         """
-        return len(self.positive_words.intersection(words))
+        # set & frozenset runs in C and iterates whichever of the two is smaller
+        word_set = words if isinstance(words, (set, frozenset)) else set(words)
+        return len(word_set & self.positive_words)
 
     def negative_score(self, words):
         """
         Calculates the negative score for a given set of words.
 
         Parameters:
-        - words (list): List of words.
+        - words (set or list): Words of the article, deduplicated if not already a set.
 
         Returns:
         - int: Negative score.
 
         """
-        return len(self.negative_words.intersection(words))
+        # set & frozenset runs in C and iterates whichever of the two is smaller
+        word_set = words if isinstance(words, (set, frozenset)) else set(words)
+        return len(word_set & self.negative_words)
 
     def polarity_score(self, positive_score, negative_score):
         """
@@ -103,47 +110,19 @@ class Analyser:
         """
         return (positive_score + negative_score) / (num_words + 0.000001)
 
-    def average_sentence_length(self, words, sentences):
+    def average_sentence_length(self, num_words, num_sentences):
         """
         Calculates the average sentence length.
 
         Parameters:
-        - words (list): List of words.
-        - sentences (list): List of sentences.
+        - num_words (int): Number of words.
+        - num_sentences (int): Number of sentences.
 
         Returns:
         - float: Average sentence length.
 
         """
-        return len(words) / len(sentences)
-
-    def complex_words(self, words):
-        """
-        Identifies and counts complex words in a set of words.
-
-        Parameters:
-        - words (list): List of words.
-
-        Returns:
-        - list: List of complex words.
-
-        """
-        complex_words = [word for word in words if self.syllable_count(word) > 2]
-        self.complex_words_count = len(complex_words)
-        return complex_words
-
-    def average_word_length(self, words):
-        """
-        Calculates the average word length.
-
-        Parameters:
-        - words (list): List of words.
-
-        Returns:
-        - float: Average word length.
-
-        """
-        return sum(len(word) for word in words) / len(words) if words else 0.0
+        return num_words / num_sentences
 
     def syllable_count(self, word):
         """
@@ -158,150 +137,129 @@ class Analyser:
         """
         return sylco(word) if word else 0.0
 
-    def clean(self, words):
-        """
-        Cleans and filters a set of words.
-
-        Parameters:
-        - words (list): List of words.
-
-        Returns:
-        - list: List of cleaned and filtered words.
-
-        """
-
-        def clean_and_filter(text):
-            # Use regular expression to remove non-alphabetic characters
-            cleaned_text = re.sub(r'[^a-zA-Z\s]', '', text).strip()
-            if cleaned_text in PERSONAL_PRONOUNS:
-                self.personal_pronouns += 1
-            return cleaned_text.lower()
-
-        words = [clean_and_filter(word) for word in words]
-        words = [word for word in words if word]
-        return words
-
-    def clean_stop_words(self, words):
-        """
-        Removes stopwords from a set of words.
-
-        Parameters:
-        - words (list): List of words.
-
-        Returns:
-        - list: List of words after removing stopwords.
-
-        """
-        words = [word for word in words if word not in self.stopwords]
-        return words
-
     def analyse(self, url_id, url):
         """
-        Performs text analysis and writes the results to an output CSV file.
+        Performs text analysis and returns the results as one output row.
 
         Parameters:
         - url_id (str): Identifier for the URL.
         - url (str): URL of the article.
 
+        Returns:
+        - tuple: One output row, in OUTPUT_COLUMNS order.
+
         """
-        text = open(os.path.join(EXTRACTED_DATA_FOLDER, url_id + ".txt"), encoding='utf-8').read()
+        with open(os.path.join(EXTRACTED_DATA_FOLDER, url_id + ".txt"), encoding='utf-8') as f:
+            text = f.read()
 
         if not text:
-            # write all these into output.csv file for unique url_id
-            # Create a DataFrame with the extracted values
-            data = {
-                'URL_ID': [url_id],
-                'URL': [url],
-                'POSITIVE SCORE': ['NaN'],
-                'NEGATIVE SCORE': ['NaN'],
-                'SUBJECTIVITY SCORE': ['NaN'],
-                'POLARITY SCORE': ['NaN'],
-                'AVG SENTENCE LENGTH': ['NaN'],
-                'PERCENTAGE OF COMPLEX WORDS': ['NaN'],
-                'FOG INDEX': ['NaN'],
-                'AVG NUMBER OF WORDS PER SENTENCE': ['NaN'],
-                'COMPLEX WORD COUNT': ['NaN'],
-                'WORD COUNT': ['NaN'],
-                'SYLLABLE PER WORD': ['NaN'],
-                'PERSONAL PRONOUNS': ['NaN'],
-                'AVG WORD LENGTH': ['NaN']
-            }
-
-            df = pd.DataFrame(data)
-
-            # Specify the path to the CSV file
-            output_csv_path = 'output.csv'
-
-            # Write the DataFrame to a CSV file
-            df.to_csv(output_csv_path, index=False, mode='a',
-                      header=not os.path.exists(output_csv_path))  # 'a' for append
-            return
-
-        sentences = nltk.sent_tokenize(text)
-        words = nltk.word_tokenize(text)
-
-        words = self.clean(words)
+            # no article text could be extracted, mark every score as missing
+            return (url_id, url) + _EMPTY_SCORES
+
+        # only the number of sentences is needed, so count the matches without keeping them
+        number_of_sentences = sum(1 for _ in _SENT_RE.finditer(text))
 
+        # single pass over the tokens: count how often each one occurs as written
         # considered removal of punctuation marks before going on except stopwords
-        # which will be removed from step 5
-        self.number_of_words = len(words)
-        self.number_of_sentences = len(sentences)
+        # which are only excluded from task 5 onwards
+        token_counts = Counter(match.group() for match in _WORD_RE.finditer(text))
+
+        # fold the distinct tokens into cleaned, lowercased words
+        word_counts = {}
+        personal_pronouns = 0
+        for token, count in token_counts.items():
+            word = sys.intern(token.lower())
+            # tokens are letters only, apart from the apostrophe of contraction suffixes
+            if "'" in word:
+                word = word.translate(_PUNCT_TABLE)
+            # pronouns match in any case, except the all-caps country name US
+            if word in PERSONAL_PRONOUNS and token != 'US':
+                personal_pronouns += count
+            word_counts[word] = word_counts.get(word, 0) + count
+
+        number_of_words = sum(word_counts.values())
+
+        # the per-word measures are computed once for each distinct word and weighted by its count
+        complex_words_count = 0
+        word_count = 0
+        syllable_sum = 0
+        word_length_sum = 0
+        for word, count in word_counts.items():
+            syllables = self.syllable_count(word)
+            if syllables > 2:
+                complex_words_count += count
+
+            if word not in self.stopwords:
+                word_count += count
+                syllable_sum += syllables * count
+                word_length_sum += len(word) * count
+
+        # a real set, so the intersection with each lexicon iterates the smaller side
+        word_set = set(word_counts)
 
         # task 1.3
-        positive_score = self.positive_score(words)
-        negative_score = self.negative_score(words)
+        positive_score = self.positive_score(word_set)
+        negative_score = self.negative_score(word_set)
         polarity_score = self.polarity_score(positive_score, negative_score)
-        subjectivity_score = self.subjectivity_score(positive_score, negative_score, len(words))
+        subjectivity_score = self.subjectivity_score(positive_score, negative_score, number_of_words)
 
         # task 2: analyse readability
-        average_sentence_length = self.average_sentence_length(words, sentences)
-        complex_words = self.complex_words(words)
-        percentage_of_complex_words = self.complex_words_count / self.number_of_words
+        average_sentence_length = self.average_sentence_length(number_of_words, number_of_sentences)
+        percentage_of_complex_words = complex_words_count / number_of_words
         fog_index = 0.4 * (average_sentence_length + percentage_of_complex_words)
 
         # task 3:
-        average_number_of_words_per_sentence = self.number_of_words / self.number_of_sentences
+        average_number_of_words_per_sentence = number_of_words / number_of_sentences
 
         # task 4:
-        complex_word_count = self.complex_words_count
+        complex_word_count = complex_words_count
 
         # task 5: from here I have considered all steps exclude stopwords
-        words = self.clean_stop_words(words)
-        word_count = len(words)
+        # word_count, syllable_sum and word_length_sum were accumulated above
 
         # task 6:
-        syllable_per_word = sum(self.syllable_count(word) for word in words) / len(words) if words else 0.0
+        syllable_per_word = syllable_sum / word_count if word_count else 0.0
 
-        #  task 7:
-        personal_pronouns = self.personal_pronouns
+        #  task 7: personal_pronouns was accumulated above
 
         # task 8:
-        average_word_length = self.average_word_length(words)
-
-        # write all these into output.csv file for unique url_id
-        # Create a DataFrame with the extracted values
-        data = {
-            'URL_ID': [url_id],
-            'URL': [url],
-            'POSITIVE SCORE': [positive_score],
-            'NEGATIVE SCORE': [negative_score],
-            'SUBJECTIVITY SCORE': [subjectivity_score],
-            'POLARITY SCORE': [polarity_score],
-            'AVG SENTENCE LENGTH': [average_sentence_length],
-            'PERCENTAGE OF COMPLEX WORDS': [percentage_of_complex_words],
-            'FOG INDEX': [fog_index],
-            'AVG NUMBER OF WORDS PER SENTENCE': [average_number_of_words_per_sentence],
-            'COMPLEX WORD COUNT': [complex_word_count],
-            'WORD COUNT': [word_count],
-            'SYLLABLE PER WORD': [syllable_per_word],
-            'PERSONAL PRONOUNS': [personal_pronouns],
-            'AVG WORD LENGTH': [average_word_length]
-        }
-
-        df = pd.DataFrame(data)
-
-        # Specify the path to the CSV file
-        output_csv_path = 'output.csv'
-
-        # Write the DataFrame to a CSV file
-        df.to_csv(output_csv_path, index=False, mode='a', header=not os.path.exists(output_csv_path))  # 'a' for append
+        average_word_length = word_length_sum / word_count if word_count else 0.0
+
+        # one row of the output.csv file for this url_id, in OUTPUT_COLUMNS order
+        return (url_id, url, positive_score, negative_score, subjectivity_score, polarity_score,
+                average_sentence_length, percentage_of_complex_words, fog_index,
+                average_number_of_words_per_sentence, complex_word_count, word_count,
+                syllable_per_word, personal_pronouns, average_word_length)
+
+
+# Analyser of the current worker process, set up once by init_worker
+_analyser = None
+
+
+def init_worker(positive_words, negative_words, stopwords):
+    """
+    Initializes the Analyser used by every task of a worker process.
+
+    Parameters:
+    - positive_words (frozenset): Set of positive words.
+    - negative_words (frozenset): Set of negative words.
+    - stopwords (frozenset): Set of stopwords.
+
+    """
+    global _analyser
+    _analyser = Analyser(positive_words, negative_words, stopwords)
+
+
+def analyse_file(args):
+    """
+    Analyses the extracted text of one URL inside a worker process.
+
+    Parameters:
+    - args (tuple): URL_ID and URL of the article.
+
+    Returns:
+    - tuple: One output row, in OUTPUT_COLUMNS order.
+
+    """
+    url_id, url = args
+    return _analyser.analyse(url_id, url)
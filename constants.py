@@ -2,6 +2,12 @@ STOP_W_DIR = "StopWords"
 POS_N_DIR = "MasterDictionary"
 DRIVER_FOLDER_PATH = "WebDriver"
 EXTRACTED_DATA_FOLDER = "extracted_text_files"
-PERSONAL_PRONOUNS = {"I", "we", "my", "ours", "us"}
+PERSONAL_PRONOUNS = frozenset({"i", "we", "my", "ours", "us"})
 INPUT_FILE_NAME = "Input.txt"
 
+OUTPUT_FILE_NAME = "output.csv"
+OUTPUT_COLUMNS = [
+    'URL_ID', 'URL', 'POSITIVE SCORE', 'NEGATIVE SCORE', 'SUBJECTIVITY SCORE', 'POLARITY SCORE',
+    'AVG SENTENCE LENGTH', 'PERCENTAGE OF COMPLEX WORDS', 'FOG INDEX', 'AVG NUMBER OF WORDS PER SENTENCE',
+    'COMPLEX WORD COUNT', 'WORD COUNT', 'SYLLABLE PER WORD', 'PERSONAL PRONOUNS', 'AVG WORD LENGTH'
+]
@@ -9,6 +9,36 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 import pandas as pd
 
+# joins the text of the p, ol li, ul li and h2 elements below arguments[0], each preceded by a space;
+# like WebElement.text, an element that is not displayed contributes '' and the rest is trimmed
+_TAGS_TEXT_SCRIPT = """
+const root = arguments[0];
+let out = '';
+for (const selector of ['p', 'ol li', 'ul li', 'h2']) {
+    root.querySelectorAll(selector).forEach(e => {
+        const displayed = e.getClientRects().length > 0 && getComputedStyle(e).visibility !== 'hidden';
+        out += ' ' + (displayed ? e.innerText.trim() : '');
+    });
+}
+return out;
+"""
+
+
+def _read_words(path):
+    """
+    Yields the first word of every non-empty line of a word list file, lowercased.
+
+    The word lists are not UTF-8 clean, so they are decoded as latin-1 which accepts any byte.
+    Comment lines starting with ';' are skipped.
+
+    """
+    with open(path, 'r', encoding='latin-1') as f:
+        # a UTF-8 byte order mark shows up as these three characters when read as latin-1
+        text = f.read().removeprefix('\xef\xbb\xbf')
+        for line in text.splitlines():
+            words = line.split()
+            if words and not words[0].startswith(';'):
+                yield words[0].lower()
 
 
 class Extractor:
@@ -32,13 +62,19 @@ class Extractor:
 
     def __init__(self):
         """
-        Initializes the Extractor by setting up the Selenium WebDriver.
+        Initializes the Extractor by setting up the Selenium WebDriver and the folder for extracted texts.
 
         """
         # Initialize selenium web driver
         opts = webdriver.ChromeOptions()
+        # only the DOM text is read, so driver.get can return once the HTML is parsed
+        # instead of waiting for images, fonts and other subresources
+        opts.page_load_strategy = 'eager'
+        opts.add_argument('--blink-settings=imagesEnabled=false')
         self.driver = webdriver.Chrome(options=opts)
         os.environ['PATH'] += DRIVER_FOLDER_PATH
+        # create the output folder once here instead of checking for it on every url
+        os.makedirs(EXTRACTED_DATA_FOLDER, exist_ok=True)
         # Add options for the chrome driver if needed
         # self.driver.implicitly_wait(3)
         # self.wait = WebDriverWait(self.driver, 10)
@@ -69,17 +105,12 @@ class Extractor:
         - directory (str): Path to the directory containing stopwords files.
 
         Returns:
-        - list: A list of stopwords.
+        - frozenset: A set of stopwords.
 
         """
-        stopwords = []
-        for file in os.listdir(directory):
-            with open(os.path.join(directory, file), 'r') as f:
-                for line in f.read().split('\n'):
-                    words = line.split() if line else []
-                    if words:
-                        stopwords.append(words[0].lower())
-        return stopwords
+        return frozenset(word
+                         for file in os.listdir(directory)
+                         for word in _read_words(os.path.join(directory, file)))
 
     def extract_positive_n_negative(self, directory=POS_N_DIR):
         """
@@ -89,16 +120,12 @@ class Extractor:
         - directory (str): Path to the directory containing positive and negative words files.
 
         Returns:
-        - tuple: A tuple containing lists of positive and negative words.
+        - tuple: A tuple containing sets of positive and negative words.
 
         """
         file1, file2 = os.listdir(directory)
-        positive = []
-        negative = []
-        with open(os.path.join(directory, file1), 'r') as f:
-            positive += f.read().split('\n')
-        with open(os.path.join(directory, file2), 'r') as f:
-            negative += f.read().split('\n')
+        positive = frozenset(_read_words(os.path.join(directory, file1)))
+        negative = frozenset(_read_words(os.path.join(directory, file2)))
         return positive, negative
 
     def extract_urls(self):
@@ -112,11 +139,11 @@ class Extractor:
         # Specify the path to your Excel file (xlsx)
         excel_file_path = INPUT_FILE_NAME
 
-        # Read Excel file and store tuples in a list
-        df = pd.read_excel(excel_file_path)
+        # Read only the two needed columns of the Excel file
+        df = pd.read_excel(excel_file_path, usecols=['URL_ID', 'URL'])
 
-        # Convert DataFrame to a list of tuples and return
-        return list(df.itertuples(index=False, name=None))
+        # Zip the plain column lists into tuples and return
+        return list(zip(df['URL_ID'].tolist(), df['URL'].tolist()))
 
     def extract_text_and_save(self, url_id, url):
         """
@@ -157,23 +184,11 @@ class Extractor:
                 tags = None
 
         if text and tags:
-            for tag in tags.find_elements(By.TAG_NAME, 'p'):
-                text += " " + tag.text
-
-            for tag in tags.find_elements(By.TAG_NAME, 'ol'):
-                for li in tag.find_elements(By.TAG_NAME, 'li'):
-                    text += " " + li.text
-
-            for tag in tags.find_elements(By.TAG_NAME, 'ul'):
-                for li in tag.find_elements(By.TAG_NAME, 'li'):
-                    text += " " + li.text
-
-            for tag in tags.find_elements(By.TAG_NAME, 'h2'):
-                text += " " + tag.text
+            # collect the text of every p, ol/ul item and h2 in the browser with a single round-trip,
+            # in the same order the separate find_elements calls used to produce
+            text += self.driver.execute_script(_TAGS_TEXT_SCRIPT, tags)
 
-        if not os.path.exists('extracted_text_files'):
-            os.makedirs('extracted_text_files')
-        with open(f'extracted_text_files/{url_id}.txt', 'w', encoding='utf-8', errors='replace') as f:
+        with open(os.path.join(EXTRACTED_DATA_FOLDER, f'{url_id}.txt'), 'w', encoding='utf-8', errors='replace') as f:
             f.write(text)
         return
 
@@ -1,4 +1,9 @@
 import re
+from functools import lru_cache
+
+
+# article text repeats the same words heavily, so remember every count
+@lru_cache(maxsize=None)
 def sylco(word) :
     word = word.lower()
 
@@ -1,8 +1,11 @@
 # main.py
 
+import csv
+from concurrent.futures import ProcessPoolExecutor
+
 from data_extractor import Extractor
-from analysis import Analyser
-from helpers.create_file import create_output_csv_file
+from analysis import analyse_file, init_worker
+from constants import OUTPUT_COLUMNS, OUTPUT_FILE_NAME
 
 def main():
     """
@@ -10,9 +13,10 @@ def main():
 
     Steps:
     1. Initialize Extractor to retrieve positive/negative words, stopwords, and URLs.
-    2. Initialize Analyser with extracted word lists and stopwords.
-    3. Create an output CSV file.
-    4. For each URL, extract text and save to a text file, then perform text analysis and save the results.
+    2. For each URL, extract text and save to a text file.
+    3. Analyse the saved texts in parallel worker processes, each holding an Analyser
+       initialized with the extracted word lists and stopwords.
+    4. Write all collected results to the output CSV file in a single pass.
 
     Usage:
     Run this script to execute data extraction and text analysis.
@@ -25,14 +29,22 @@ def main():
     with Extractor() as extractor:
         positive_words, negative_words = extractor.extract_positive_n_negative()
         stopwords = extractor.extract_stopwords()
-        analyser = Analyser(positive_words, negative_words, stopwords)
 
         list_of_urls = extractor.extract_urls()
 
-        create_output_csv_file()
         for (url_id, url) in list_of_urls:
             extractor.extract_text_and_save(url_id, url)
-            analyser.analyse(url_id, url)
+
+    # the word lists are sent to each worker once, not with every url
+    with ProcessPoolExecutor(initializer=init_worker,
+                             initargs=(positive_words, negative_words, stopwords)) as executor:
+        rows = list(executor.map(analyse_file, list_of_urls, chunksize=16))
+
+    # a large buffer batches the writes of all rows into few syscalls
+    with open(OUTPUT_FILE_NAME, 'w', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(OUTPUT_COLUMNS)
+        writer.writerows(rows)
 
 if __name__ == '__main__':
     main()